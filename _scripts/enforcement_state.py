@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Enforcement State Store (SQLite)
+
+Concurrency-safe companion to enforcement-state.js for Python hooks.
+Stores the SDLC enforcement state in a SQLite database (WAL mode) so that
+parallel tool calls can update it without losing writes:
+- Counters (editsSinceTest, soc2Violations, ...) with atomic increments
+- Flags (needsSecurityReview, lastEditFile, ...) as JSON values
+- Bounded agentHistory, SOC 2 findings and securitySensitiveEdits tables
+
+The JS hooks still read and write enforcement_state.json, so export_json()
+merges the database-owned keys (DB_OWNED_KEYS) into that file (atomic
+replace) for compatibility. The JS hooks' own unlocked rewrites of the JSON
+file are unchanged and can still lose updates under parallel tool calls.
+
+The JSON file stays the source of truth for resets: a new sessionId
+(resetState in enforcement-state.js) zeroes soc2Violations and clears the
+security review, and a review cleared in the JSON (elite-security-auditor,
+clear-review-flags.js) clears it in the database too.
+
+Usage:
+  python enforcement_state.py           # Show current state
+  python enforcement_state.py export    # Merge database-owned keys into enforcement_state.json
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+from datetime import datetime, timezone
+
+_CLAUDE_DIR = os.path.join(os.environ.get("USERPROFILE") or os.environ.get("HOME") or os.path.expanduser("~"),
+                           ".claude")
+# JSON file read by the JS hooks - same path as enforcement-state.js in this folder
+STATE_FILE = os.path.join(_CLAUDE_DIR, "hooks", ".enforcement_state.json")
+# The database stays in hooks-state (local), not hooks (synced via OneDrive)
+STATE_DIR = os.path.join(_CLAUDE_DIR, "hooks-state")
+STATE_DB = os.path.join(STATE_DIR, "enforcement_state.db")
+
+# Keep in sync with enforcement-state.js
+MAX_AGENT_HISTORY = 20
+MAX_FINDINGS = 200
+MAX_SECURITY_SENSITIVE_EDITS = 50
+
+# Keys the database owns (written by the Python hooks). The JS hooks update
+# everything else directly in the JSON file, so export only these by default.
+DB_OWNED_KEYS = ("soc2Violations", "needsSecurityReview", "securitySensitiveEdits")
+
+# Keys from DEFAULT_STATE in enforcement-state.js, split by storage type
+COUNTER_KEYS = ("editsSinceTest", "editsSinceSecurityReview", "editsSinceDevopsReview")
+FLAG_KEYS = ("lastEditTimestamp", "lastEditFile", "needsTesting",
+             "needsSecurityReview", "needsDevopsReview", "sessionId")
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS counters (
+    name  TEXT PRIMARY KEY,
+    value INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS flags (
+    name  TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS agent_history (
+    id        INTEGER PRIMARY KEY AUTOINCREMENT,
+    agent     TEXT NOT NULL,
+    task      TEXT,
+    timestamp TEXT NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS agent_history_bound AFTER INSERT ON agent_history
+BEGIN
+    DELETE FROM agent_history WHERE id <= NEW.id - {MAX_AGENT_HISTORY};
+END;
+CREATE TABLE IF NOT EXISTS findings (
+    id        INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    file_path TEXT,
+    rule      TEXT NOT NULL,
+    decision  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS findings_file ON findings (file_path);
+CREATE TRIGGER IF NOT EXISTS findings_bound AFTER INSERT ON findings
+BEGIN
+    DELETE FROM findings WHERE id <= NEW.id - {MAX_FINDINGS};
+END;
+CREATE TABLE IF NOT EXISTS security_sensitive_edits (
+    id        INTEGER PRIMARY KEY AUTOINCREMENT,
+    file_path TEXT NOT NULL UNIQUE,
+    timestamp TEXT NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS security_sensitive_edits_bound AFTER INSERT ON security_sensitive_edits
+BEGIN
+    DELETE FROM security_sensitive_edits WHERE id <= NEW.id - {MAX_SECURITY_SENSITIVE_EDITS};
+END;
+"""
+
+_local = threading.local()
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def get_connection(db_path: str = None) -> sqlite3.Connection:
+    """Return a cached connection (per thread, per path) with the schema in place."""
+    db_path = db_path or STATE_DB
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+    conn = connections.get(db_path)
+    if conn is not None:
+        return conn
+
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    is_new = not os.path.exists(db_path)
+    # Autocommit mode - transactions are opened explicitly with BEGIN IMMEDIATE
+    conn = sqlite3.connect(db_path, timeout=5.0, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    connections[db_path] = conn
+
+    # First run: seed from the existing JSON state so nothing is lost
+    if is_new and db_path == STATE_DB:
+        import_json(STATE_FILE, db_path)
+    return conn
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT/ROLLBACK, so read-modify-write is atomic across processes."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("COMMIT" if exc_type is None else "ROLLBACK")
+        return False
+
+
+def increment(name: str, amount: int = 1, db_path: str = None) -> int:
+    """Atomically add amount to a counter and return the new value."""
+    conn = get_connection(db_path)
+    with _Transaction(conn):
+        conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, amount),
+        )
+        return conn.execute("SELECT value FROM counters WHERE name = ?", (name,)).fetchone()[0]
+
+
+def reset_counter(name: str, db_path: str = None) -> None:
+    """Set a counter back to zero."""
+    conn = get_connection(db_path)
+    conn.execute(
+        "INSERT INTO counters (name, value) VALUES (?, 0) "
+        "ON CONFLICT(name) DO UPDATE SET value = 0",
+        (name,),
+    )
+
+
+def get_counter(name: str, db_path: str = None) -> int:
+    row = get_connection(db_path).execute("SELECT value FROM counters WHERE name = ?", (name,)).fetchone()
+    return row[0] if row else 0
+
+
+def set_flag(name: str, value, db_path: str = None) -> None:
+    """Set a flag to any JSON-serializable value."""
+    conn = get_connection(db_path)
+    conn.execute(
+        "INSERT INTO flags (name, value) VALUES (?, ?) "
+        "ON CONFLICT(name) DO UPDATE SET value = excluded.value",
+        (name, json.dumps(value)),
+    )
+
+
+def get_flag(name: str, default=None, db_path: str = None):
+    row = get_connection(db_path).execute("SELECT value FROM flags WHERE name = ?", (name,)).fetchone()
+    return json.loads(row[0]) if row else default
+
+
+def record_agent_completion(agent_type: str, task_description: str = "", db_path: str = None) -> None:
+    """Append to agentHistory (trigger keeps the last MAX_AGENT_HISTORY entries)."""
+    get_connection(db_path).execute(
+        "INSERT INTO agent_history (agent, task, timestamp) VALUES (?, ?, ?)",
+        (agent_type, task_description, _now()),
+    )
+
+
+def get_agent_history(db_path: str = None) -> list:
+    rows = get_connection(db_path).execute(
+        "SELECT agent, task, timestamp FROM agent_history ORDER BY id"
+    ).fetchall()
+    return [{"agent": a, "task": t, "timestamp": ts} for a, t, ts in rows]
+
+
+def _read_json(json_path: str = None) -> dict:
+    try:
+        with open(json_path or STATE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _clear_security_review(conn: sqlite3.Connection) -> None:
+    conn.execute("DELETE FROM security_sensitive_edits")
+    conn.executemany(
+        "INSERT INTO flags (name, value) VALUES (?, 'false') "
+        "ON CONFLICT(name) DO UPDATE SET value = excluded.value",
+        [("needsSecurityReview",), ("securityReviewExported",)],
+    )
+
+
+def _reconcile(conn: sqlite3.Connection, data: dict) -> None:
+    """
+    Apply resets made by the JS hooks in the JSON file (call inside a transaction):
+    - New sessionId (resetState): soc2Violations back to 0, security review cleared
+    - needsSecurityReview cleared after we exported it as true: review done
+    """
+    row = conn.execute("SELECT value FROM flags WHERE name = 'sessionId'").fetchone()
+    session_id = data.get("sessionId")
+    if session_id is not None and (row is None or json.loads(row[0]) != session_id):
+        conn.execute(
+            "INSERT INTO counters (name, value) VALUES ('soc2Violations', 0) "
+            "ON CONFLICT(name) DO UPDATE SET value = 0"
+        )
+        _clear_security_review(conn)
+        conn.execute(
+            "INSERT INTO flags (name, value) VALUES ('sessionId', ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = excluded.value",
+            (json.dumps(session_id),),
+        )
+        return
+
+    row = conn.execute("SELECT value FROM flags WHERE name = 'securityReviewExported'").fetchone()
+    if row and json.loads(row[0]) and not data.get("needsSecurityReview"):
+        _clear_security_review(conn)
+
+
+def record_findings(file_path: str, rules: list, decision: str, db_path: str = None,
+                    json_path: str = None) -> int:
+    """
+    Record SOC 2 rule hits for a file in one transaction, after applying any
+    session reset or cleared review from the JSON file.
+    Only rule names are stored - never the matched text, which may be a secret.
+    Returns the new soc2Violations counter value.
+    """
+    data = _read_json(json_path)
+    conn = get_connection(db_path)
+    timestamp = _now()
+    with _Transaction(conn):
+        _reconcile(conn, data)
+        conn.executemany(
+            "INSERT INTO findings (timestamp, file_path, rule, decision) VALUES (?, ?, ?, ?)",
+            [(timestamp, file_path, rule, decision) for rule in rules],
+        )
+        conn.execute(
+            "INSERT INTO counters (name, value) VALUES ('soc2Violations', ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (len(rules),),
+        )
+        conn.execute(
+            "INSERT INTO flags (name, value) VALUES ('needsSecurityReview', 'true') "
+            "ON CONFLICT(name) DO UPDATE SET value = excluded.value"
+        )
+        if file_path:
+            conn.execute(
+                "INSERT INTO security_sensitive_edits (file_path, timestamp) VALUES (?, ?) "
+                "ON CONFLICT(file_path) DO NOTHING",
+                (file_path, timestamp),
+            )
+        return conn.execute("SELECT value FROM counters WHERE name = 'soc2Violations'").fetchone()[0]
+
+
+def get_findings(limit: int = MAX_FINDINGS, db_path: str = None) -> list:
+    rows = get_connection(db_path).execute(
+        "SELECT timestamp, file_path, rule, decision FROM findings ORDER BY id DESC LIMIT ?", (limit,)
+    ).fetchall()
+    return [{"timestamp": ts, "file": f, "rule": r, "decision": d} for ts, f, r, d in rows]
+
+
+def get_security_sensitive_edits(db_path: str = None) -> list:
+    rows = get_connection(db_path).execute(
+        "SELECT file_path FROM security_sensitive_edits ORDER BY id"
+    ).fetchall()
+    return [f for (f,) in rows]
+
+
+def get_state(db_path: str = None) -> dict:
+    """Return the database contents shaped like the JS enforcement state."""
+    conn = get_connection(db_path)
+    state = {name: value for name, value in conn.execute("SELECT name, value FROM counters")}
+    state.update({name: json.loads(value) for name, value in conn.execute("SELECT name, value FROM flags")})
+    state["agentHistory"] = get_agent_history(db_path)
+    state["securitySensitiveEdits"] = get_security_sensitive_edits(db_path)
+    return state
+
+
+def import_json(json_path: str = None, db_path: str = None) -> bool:
+    """Load an existing enforcement_state.json into the database (used on first run)."""
+    data = _read_json(json_path)
+    if not data:
+        return False
+
+    conn = get_connection(db_path)
+    with _Transaction(conn):
+        for key, value in data.items():
+            if key == "securitySensitiveEdits":
+                conn.executemany(
+                    "INSERT OR IGNORE INTO security_sensitive_edits (file_path, timestamp) VALUES (?, ?)",
+                    [(f, _now()) for f in (value or [])[-MAX_SECURITY_SENSITIVE_EDITS:] if isinstance(f, str)],
+                )
+            elif key == "agentHistory":
+                conn.executemany(
+                    "INSERT INTO agent_history (agent, task, timestamp) VALUES (?, ?, ?)",
+                    [(e.get("agent", ""), e.get("task"), e.get("timestamp") or _now())
+                     for e in (value or [])[-MAX_AGENT_HISTORY:] if isinstance(e, dict)],
+                )
+            elif isinstance(value, int) and not isinstance(value, bool):
+                conn.execute("INSERT OR REPLACE INTO counters (name, value) VALUES (?, ?)", (key, value))
+            else:
+                conn.execute("INSERT OR REPLACE INTO flags (name, value) VALUES (?, ?)", (key, json.dumps(value)))
+    return True
+
+
+def export_json(keys=None, json_path: str = None, db_path: str = None) -> bool:
+    """
+    Merge database values into enforcement_state.json for the JS hooks.
+    Only the given keys are overwritten (DB_OWNED_KEYS if None), so values the
+    JS hooks own - counters, agentHistory, editsSince* - are never replaced by
+    the stale copies seeded at first run. securitySensitiveEdits is merged with
+    the files the JS hooks already listed. The file is left untouched when
+    nothing changed.
+
+    Note: the JS hooks still rewrite the JSON file without locking, so a JS
+    save racing this read-modify-replace can still drop one side's update.
+    """
+    json_path = json_path or STATE_FILE
+    keys = DB_OWNED_KEYS if keys is None else keys
+    try:
+        original = _read_json(json_path)
+        conn = get_connection(db_path)
+        with _Transaction(conn):
+            _reconcile(conn, original)
+
+        data = dict(original)
+        state = get_state(db_path)
+        for key in keys:
+            if key == "securitySensitiveEdits":
+                listed = list(data.get(key) or [])
+                data[key] = listed + [f for f in state[key] if f not in listed]
+            elif key in state:
+                data[key] = state[key]
+        if data != original:
+            # Write to a temp file and swap it in so readers never see a partial file
+            tmp_path = f"{json_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, json_path)
+        # Remember the JSON shows a pending review, so clearing it there clears it here
+        if data.get("needsSecurityReview"):
+            set_flag("securityReviewExported", True, db_path)
+        return True
+    except Exception as e:
+        print(f"Failed to export enforcement state: {e}", file=sys.stderr)
+        return False
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "export":
+        sys.exit(0 if export_json() else 1)
+    print("Current Enforcement State:")
+    print(json.dumps(get_state(), indent=2))
@@ -270,6 +270,16 @@ if !ERRORLEVEL! EQU 0 (
     echo [%DATE% %TIME%] WARNING: check-aws-sso.js copy failed >> "%LOG_FILE%"
 )
 
+REM Copy enforcement state store (used by soc2-validator.py to record findings)
+copy "%SCRIPTS_DIR%\enforcement_state.py" "%USERPROFILE%\.claude\hooks\enforcement_state.py" /Y >nul
+if !ERRORLEVEL! EQU 0 (
+    echo [OK] Enforcement state store installed
+    echo [%DATE% %TIME%] enforcement_state.py copied >> "%LOG_FILE%"
+) else (
+    echo WARNING: Failed to copy enforcement state store
+    echo [%DATE% %TIME%] WARNING: enforcement_state.py copy failed >> "%LOG_FILE%"
+)
+
 REM Copy Hindsight capture hook
 echo   Installing Hindsight memory capture hook...
 if not exist "%USERPROFILE%\.claude\hooks\hindsight" (
@@ -284,6 +294,16 @@ if !ERRORLEVEL! EQU 0 (
     echo [%DATE% %TIME%] WARNING: hindsight/capture.js copy failed >> "%LOG_FILE%"
 )
 
+REM Copy Hindsight transcript exporter (used by capture.js at session end)
+copy "%SCRIPTS_DIR%\hindsight\transcript_export.py" "%USERPROFILE%\.claude\hooks\hindsight\transcript_export.py" /Y >nul
+if !ERRORLEVEL! EQU 0 (
+    echo [OK] Hindsight transcript exporter installed
+    echo [%DATE% %TIME%] hindsight/transcript_export.py copied >> "%LOG_FILE%"
+) else (
+    echo WARNING: Failed to copy Hindsight transcript exporter
+    echo [%DATE% %TIME%] WARNING: hindsight/transcript_export.py copy failed >> "%LOG_FILE%"
+)
+
 REM Copy sync hook if needed
 if "%NEEDS_SYNC_HOOK%"=="1" (
     echo   Copying CLAUDE.md sync hook...
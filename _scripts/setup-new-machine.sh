@@ -200,6 +200,14 @@ else
     echo "WARNING: check-aws-sso.js not found"
 fi
 
+# Copy enforcement state store (used by soc2-validator.py to record findings)
+if [ -f "$SCRIPTS_DIR/enforcement_state.py" ]; then
+    cp "$SCRIPTS_DIR/enforcement_state.py" "$HOME/.claude/hooks/enforcement_state.py"
+    echo "✓ Enforcement state store installed"
+else
+    echo "WARNING: enforcement_state.py not found"
+fi
+
 # Copy Hindsight capture hook
 if [ -f "$SCRIPTS_DIR/hindsight/capture.js" ]; then
     cp "$SCRIPTS_DIR/hindsight/capture.js" "$HOME/.claude/hooks/hindsight/capture.js"
@@ -208,6 +216,14 @@ else
     echo "WARNING: hindsight/capture.js not found"
 fi
 
+# Copy Hindsight transcript exporter (used by capture.js at session end)
+if [ -f "$SCRIPTS_DIR/hindsight/transcript_export.py" ]; then
+    cp "$SCRIPTS_DIR/hindsight/transcript_export.py" "$HOME/.claude/hooks/hindsight/transcript_export.py"
+    echo "✓ Hindsight transcript exporter installed"
+else
+    echo "WARNING: hindsight/transcript_export.py not found"
+fi
+
 # Copy sync hook (always, as backup for symlink)
 if [ -f "$SCRIPTS_DIR/sync-claude-md.js" ]; then
     cp "$SCRIPTS_DIR/sync-claude-md.js" "$HOME/.claude/hooks/sync-claude-md.js"
@@ -8,6 +8,7 @@
  * - Retry queue for failed requests
  * - Adaptive timeouts based on endpoint
  * - FILTERED CAPTURE: Skips low-value tools to reduce noise
+ * - Secrets masked with soc2-validator.py --redact before anything is sent
  *
  * Updated: 2026-01-12 - Added filtering to improve memory quality
  */
@@ -15,6 +16,7 @@
 const http = require('http');
 const fs = require('fs');
 const path = require('path');
+const { spawn, spawnSync } = require('child_process');
 
 // Tools to SKIP (low-value, high-noise)
 // These are captured in full transcript at session end anyway
@@ -51,6 +53,11 @@ const MAX_RETRIES = 2;
 const RETRY_QUEUE_PATH = path.join(process.env.HOME || process.env.USERPROFILE, '.claude', 'hooks', 'hindsight', '.retry_queue.json');
 const SYNC_TRACKER_PATH = path.join(process.env.HOME || process.env.USERPROFILE, '.claude', 'hooks', 'hindsight', '.synced_transcripts');
 
+// SOC 2 validator (installed one level up) - used to mask secrets before upload
+const SOC2_VALIDATOR = path.join(__dirname, '..', 'soc2-validator.py');
+const PYTHON = process.platform === 'win32' ? 'python' : 'python3';
+const REDACT_TIMEOUT = 3000;
+
 // Standard hook response - ALWAYS return quickly
 const HOOK_RESPONSE = JSON.stringify({ continue: true, suppressOutput: true });
 
@@ -136,9 +143,6 @@ function formatToolUse(toolName, toolInput, toolResponse) {
   let content = `[Tool Use: ${toolName}]\n`;
 
   if (toolInput) {
-    if (typeof toolInput === 'string') {
-      try { toolInput = JSON.parse(toolInput); } catch {}
-    }
     if (toolInput.command) content += `Command: ${toolInput.command}\n`;
     if (toolInput.file_path) content += `File: ${toolInput.file_path}\n`;
     if (toolInput.pattern) content += `Pattern: ${toolInput.pattern}\n`;
@@ -155,6 +159,43 @@ function formatToolUse(toolName, toolInput, toolResponse) {
   return content;
 }
 
+// Mask secrets in outbound content via soc2-validator.py --redact
+// Returns null if the validator is installed but redaction failed - never send unscrubbed content then
+function redactContent(content) {
+  if (!fs.existsSync(SOC2_VALIDATOR)) return content;
+  try {
+    const result = spawnSync(PYTHON, [SOC2_VALIDATOR, '--redact'], {
+      input: content,
+      encoding: 'utf8',
+      timeout: REDACT_TIMEOUT,
+      windowsHide: true
+    });
+    if (result.status === 0 && typeof result.stdout === 'string') return result.stdout;
+  } catch {}
+  return null;
+}
+
+// Mask secrets in structured values (tool_input, tool_response, ...) via soc2-validator.py --redact --jsonl
+// Runs before formatting, so truncation and JSON escaping can't split a secret away from its key.
+// One validator run for the whole batch; returns null on failure, like redactContent
+function redactRecords(records) {
+  if (!fs.existsSync(SOC2_VALIDATOR)) return records;
+  try {
+    const input = records.map(record => JSON.stringify(record ?? null)).join('\n') + '\n';
+    const result = spawnSync(PYTHON, [SOC2_VALIDATOR, '--redact', '--jsonl'], {
+      input,
+      encoding: 'utf8',
+      timeout: REDACT_TIMEOUT,
+      windowsHide: true
+    });
+    if (result.status !== 0 || typeof result.stdout !== 'string') return null;
+    const lines = result.stdout.split('\n').filter(Boolean);
+    if (lines.length !== records.length) return null;
+    return lines.map(line => JSON.parse(line));
+  } catch {}
+  return null;
+}
+
 // Check if transcript was already synced
 function wasTranscriptSynced(transcriptPath) {
   try {
@@ -173,7 +214,31 @@ function markTranscriptSynced(transcriptPath) {
   } catch {}
 }
 
-// Sync full transcript (for session end)
+// Streaming transcript exporter (chunked, resumes from the last synced byte offset)
+const TRANSCRIPT_EXPORTER = path.join(__dirname, 'transcript_export.py');
+
+// Sync transcript (for session end) - hand off to the Python exporter when available
+function syncTranscript(transcriptPath, sessionId) {
+  if (!transcriptPath || !fs.existsSync(TRANSCRIPT_EXPORTER)) {
+    syncFullTranscript(transcriptPath, sessionId);
+    return;
+  }
+
+  try {
+    const child = spawn(PYTHON, [TRANSCRIPT_EXPORTER, transcriptPath, sessionId || 'unknown'], {
+      detached: true,
+      stdio: 'ignore',
+      windowsHide: true
+    });
+    // Python missing - fall back to the legacy full-file sync
+    child.on('error', () => syncFullTranscript(transcriptPath, sessionId));
+    child.unref();
+  } catch {
+    syncFullTranscript(transcriptPath, sessionId);
+  }
+}
+
+// Sync full transcript (legacy fallback when transcript_export.py can't run)
 function syncFullTranscript(transcriptPath, sessionId) {
   try {
     if (!transcriptPath || !fs.existsSync(transcriptPath)) return;
@@ -229,7 +294,8 @@ function syncFullTranscript(transcriptPath, sessionId) {
     }
 
     markTranscriptSynced(transcriptPath);
-    storeMemoryAsync(formattedConversation);
+    formattedConversation = redactContent(formattedConversation);
+    if (formattedConversation) storeMemoryAsync(formattedConversation);
   } catch {}
 }
 
@@ -287,24 +353,40 @@ async function main() {
         }
       }
 
-      memoryContent = formatToolUse(hookData.tool_name, hookData.tool_input, hookData.tool_response);
+      let toolInput = hookData.tool_input;
+      if (typeof toolInput === 'string') {
+        try { toolInput = JSON.parse(toolInput); } catch {}
+      }
+      // Secrets masked in the structured values, before anything is stringified or truncated
+      const redacted = redactRecords([toolInput, hookData.tool_response]);
+      if (!redacted) {
+        setTimeout(() => process.exit(0), 50);
+        return;
+      }
+
+      memoryContent = formatToolUse(hookData.tool_name, redacted[0], redacted[1]);
       memoryContent += `Session: ${hookData.session_id || 'unknown'}\n`;
       memoryContent += `Timestamp: ${timestamp}\n`;
     } else if (hookData.user_message || hookData.prompt) {
       // UserPromptSubmit
-      const message = hookData.user_message || hookData.prompt || hookData.content;
-      memoryContent = `[User Message]\nMessage: ${message}\nSession: ${hookData.session_id || 'unknown'}\nTimestamp: ${timestamp}\n`;
+      const redacted = redactRecords([hookData.user_message || hookData.prompt || hookData.content]);
+      if (!redacted) {
+        setTimeout(() => process.exit(0), 50);
+        return;
+      }
+      memoryContent = `[User Message]\nMessage: ${redacted[0]}\nSession: ${hookData.session_id || 'unknown'}\nTimestamp: ${timestamp}\n`;
     } else if (hookData.session_id && !hookData.tool_name) {
       // Session end - sync transcript
       memoryContent = `[Session Event]\nSession: ${hookData.session_id}\nTimestamp: ${timestamp}\n`;
       if (hookData.transcript_path) {
-        setImmediate(() => syncFullTranscript(hookData.transcript_path, hookData.session_id));
+        setImmediate(() => syncTranscript(hookData.transcript_path, hookData.session_id));
       }
     } else if (hookData.raw) {
-      memoryContent = `[Activity]\n${hookData.raw}\nTimestamp: ${timestamp}\n`;
+      const raw = redactContent(hookData.raw);
+      if (raw) memoryContent = `[Activity]\n${raw}\nTimestamp: ${timestamp}\n`;
     }
 
-    // Fire-and-forget store (non-blocking)
+    // Fire-and-forget store (non-blocking) - secrets were masked above
     if (memoryContent && memoryContent.length > 50) {
       setImmediate(() => storeMemoryAsync(memoryContent));
     }
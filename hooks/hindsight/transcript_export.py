@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Hindsight Transcript Exporter
+Streams a Claude Code transcript (JSONL) to Hindsight in bounded-size chunks.
+
+Replaces the full-file sync in capture.js:
+- Reads the transcript one line at a time (memory stays flat for long sessions)
+- Emits chunks of at most MAX_CHUNK_CHARS, uploaded one by one
+- Tracks progress per transcript by byte offset in a SQLite store, so a
+  resumed session only uploads the turns added since the last sync
+- A failed upload stops the run without advancing the offset - the next
+  SessionEnd picks up from the same place
+- Each run claims a lease on the transcript's row first, so two exporters
+  for the same transcript never upload the same chunks - the second skips
+
+Usage:
+  python transcript_export.py <transcript_path> [session_id] [--dry-run]
+
+Graceful Failure:
+  - Always exits 0 (runs detached from capture.js, never blocks Claude Code)
+"""
+
+import importlib.util
+import json
+import os
+import sqlite3
+import sys
+import time
+import urllib.request
+import uuid
+from datetime import datetime, timezone
+
+# Configuration - CLOUD ENDPOINT (keep in sync with capture.js)
+HINDSIGHT_HOST = '34.174.13.163'
+HINDSIGHT_PORT = 8888
+BANK_ID = 'claude-code'
+STORE_TIMEOUT = 120  # seconds (OpenAI processing)
+
+MAX_CHUNK_CHARS = 20000   # Per upload
+MAX_TURN_CHARS = 8000     # A single huge turn is truncated, not split
+LEASE_SECONDS = STORE_TIMEOUT * 2  # Renewed after every chunk; outlives one slow upload
+
+HINDSIGHT_DIR = os.path.join(os.environ.get('HOME') or os.environ.get('USERPROFILE') or os.path.expanduser('~'),
+                             '.claude', 'hooks', 'hindsight')
+SYNC_DB_PATH = os.path.join(HINDSIGHT_DIR, '.transcript_sync.db')
+LEGACY_TRACKER_PATH = os.path.join(HINDSIGHT_DIR, '.synced_transcripts')
+
+# SOC 2 validator (installed one level up) - provides redact_text()
+SOC2_VALIDATOR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'soc2-validator.py')
+
+
+def open_sync_db(db_path: str = SYNC_DB_PATH) -> sqlite3.Connection:
+    """Open the sync progress store (one row per transcript, keyed by path)."""
+    if os.path.dirname(db_path):
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=5.0, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS sync_progress (
+            transcript_path TEXT PRIMARY KEY,
+            byte_offset     INTEGER NOT NULL DEFAULT 0,
+            turns           INTEGER NOT NULL DEFAULT 0,
+            updated_at      TEXT NOT NULL,
+            lease_owner     TEXT,
+            lease_expires   REAL
+        )
+    """)
+    # Stores created before leases were added
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(sync_progress)")}
+    if 'lease_owner' not in columns:
+        conn.execute("ALTER TABLE sync_progress ADD COLUMN lease_owner TEXT")
+        conn.execute("ALTER TABLE sync_progress ADD COLUMN lease_expires REAL")
+    return conn
+
+
+def claim_lease(conn: sqlite3.Connection, transcript_path: str, owner: str) -> bool:
+    """
+    Take the transcript's export lease unless another live exporter holds it.
+    Check and claim happen in one BEGIN IMMEDIATE transaction.
+    """
+    now = time.time()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute(
+            "SELECT lease_owner, lease_expires FROM sync_progress WHERE transcript_path = ?", (transcript_path,)
+        ).fetchone()
+        if row and row[0] and row[0] != owner and (row[1] or 0) > now:
+            conn.execute("ROLLBACK")
+            return False
+        conn.execute(
+            "INSERT INTO sync_progress (transcript_path, updated_at, lease_owner, lease_expires) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(transcript_path) DO UPDATE SET lease_owner = excluded.lease_owner, "
+            "lease_expires = excluded.lease_expires",
+            (transcript_path, datetime.now(timezone.utc).isoformat(), owner, now + LEASE_SECONDS),
+        )
+        conn.execute("COMMIT")
+        return True
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def release_lease(conn: sqlite3.Connection, transcript_path: str, owner: str) -> None:
+    conn.execute(
+        "UPDATE sync_progress SET lease_owner = NULL, lease_expires = NULL "
+        "WHERE transcript_path = ? AND lease_owner = ?",
+        (transcript_path, owner),
+    )
+
+
+def _was_legacy_synced(transcript_path: str) -> bool:
+    """Check the old capture.js tracker file (one-time migration per transcript)."""
+    try:
+        with open(LEGACY_TRACKER_PATH, 'r', encoding='utf-8') as f:
+            return any(line.rstrip('\n') == transcript_path for line in f)
+    except OSError:
+        return False
+
+
+def get_progress(conn: sqlite3.Connection, transcript_path: str) -> tuple:
+    """Return (byte_offset, turns) already synced for a transcript."""
+    row = conn.execute(
+        "SELECT byte_offset, turns FROM sync_progress WHERE transcript_path = ?", (transcript_path,)
+    ).fetchone()
+    # claim_lease() may have created the row - an empty one means nothing synced yet
+    if row and (row[0] or row[1]):
+        return row[0], row[1]
+
+    # Already uploaded in full by the old capture.js - start from the current end
+    if _was_legacy_synced(transcript_path):
+        size = os.path.getsize(transcript_path)
+        save_progress(conn, transcript_path, size, 0)
+        return size, 0
+    return 0, 0
+
+
+def save_progress(conn: sqlite3.Connection, transcript_path: str, byte_offset: int, turns: int) -> None:
+    """Store progress and renew the lease of whoever holds it."""
+    conn.execute(
+        "INSERT INTO sync_progress (transcript_path, byte_offset, turns, updated_at) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT(transcript_path) DO UPDATE SET byte_offset = excluded.byte_offset, "
+        "turns = excluded.turns, updated_at = excluded.updated_at, "
+        "lease_expires = CASE WHEN lease_owner IS NULL THEN NULL ELSE ? END",
+        (transcript_path, byte_offset, turns, datetime.now(timezone.utc).isoformat(), time.time() + LEASE_SECONDS),
+    )
+
+
+def _content_text(content, include_tools: bool) -> str:
+    """Flatten message content (string or block list) to text."""
+    if isinstance(content, str):
+        return content
+    parts = []
+    if isinstance(content, list):
+        for block in content:
+            if not isinstance(block, dict):
+                continue
+            if block.get('type') == 'text':
+                parts.append(block.get('text', ''))
+            elif include_tools and block.get('type') == 'tool_use':
+                parts.append(f"\n[Used tool: {block.get('name')}]")
+    return ''.join(parts)
+
+
+def format_entry(entry: dict, turn: int) -> str:
+    """Format one transcript entry the same way capture.js did ('' if not a conversation turn)."""
+    entry_type = entry.get('type')
+    if entry_type not in ('user', 'assistant'):
+        return ''
+    message = entry.get('message') or {}
+    text = _content_text(message.get('content'), include_tools=entry_type == 'assistant')
+    if len(text) > MAX_TURN_CHARS:
+        text = text[:MAX_TURN_CHARS] + '\n[truncated]'
+    label = 'USER' if entry_type == 'user' else 'CLAUDE'
+    return f"[{label} {turn}]: {text}\n\n"
+
+
+def iter_chunks(transcript_path: str, start_offset: int = 0, start_turn: int = 0,
+                max_chars: int = MAX_CHUNK_CHARS):
+    """
+    Stream the transcript from start_offset and yield (body, end_offset, end_turn).
+    Only complete lines are consumed - a line still being written is left for
+    the next run. Each body is at most max_chars (plus one truncated turn).
+    """
+    parts = []
+    size = 0
+    offset = start_offset
+    turn = start_turn
+
+    with open(transcript_path, 'rb') as f:
+        f.seek(start_offset)
+        for raw in f:
+            if not raw.endswith(b'\n'):
+                break
+            offset += len(raw)
+            try:
+                entry = json.loads(raw)
+            except ValueError:
+                continue
+            if not isinstance(entry, dict):
+                continue
+            turn += 1
+            text = format_entry(entry, turn)
+            if not text:
+                continue
+            if parts and size + len(text) > max_chars:
+                yield ''.join(parts), offset - len(raw), turn - 1
+                parts, size = [], 0
+            parts.append(text)
+            size += len(text)
+
+    if parts:
+        yield ''.join(parts), offset, turn
+    elif offset != start_offset:
+        # Only non-conversation lines were added - still record the progress
+        yield '', offset, turn
+
+
+def load_redactor():
+    """
+    Load redact_text() from soc2-validator.py. Returns None if the validator
+    isn't installed, and raises if it is installed but can't be loaded.
+    """
+    if not os.path.exists(SOC2_VALIDATOR):
+        return None
+    spec = importlib.util.spec_from_file_location('soc2_validator', SOC2_VALIDATOR)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.redact_text
+
+
+def store_memory(content: str) -> bool:
+    """POST one memory to Hindsight. Returns True on success."""
+    data = json.dumps({'items': [{'content': content}]}).encode('utf-8')
+    req = urllib.request.Request(
+        f"http://{HINDSIGHT_HOST}:{HINDSIGHT_PORT}/v1/default/banks/{BANK_ID}/memories",
+        data=data,
+        headers={'Content-Type': 'application/json'},
+        method='POST',
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=STORE_TIMEOUT) as resp:
+            return 200 <= resp.status < 300
+    except Exception:
+        return False
+
+
+def export_transcript(transcript_path: str, session_id: str = 'unknown', send=store_memory,
+                      conn: sqlite3.Connection = None, redact=None) -> int:
+    """
+    Upload everything added to a transcript since the last sync.
+    Each chunk is passed through redact (if given) before it is sent.
+    Returns the number of chunks sent (0 if another exporter holds the lease).
+    """
+    if not transcript_path or not os.path.exists(transcript_path):
+        return 0
+    conn = conn or open_sync_db()
+    redact = redact or (lambda text: text)
+
+    owner = f"{os.getpid()}-{uuid.uuid4().hex}"
+    if not claim_lease(conn, transcript_path, owner):
+        return 0
+
+    sent = 0
+    try:
+        offset, turns = get_progress(conn, transcript_path)
+        if offset > os.path.getsize(transcript_path):
+            # Transcript was rewritten - start over
+            offset, turns = 0, 0
+
+        for body, end_offset, end_turn in iter_chunks(transcript_path, offset, turns):
+            if body:
+                header = (
+                    f"[Session Transcript]\n"
+                    f"Session: {session_id}\n"
+                    f"Transcript: {transcript_path}\n"
+                    f"Turns: {turns + 1}-{end_turn}\n"
+                    f"---\n\n"
+                )
+                if not send(redact(header + body)):
+                    break
+                sent += 1
+            save_progress(conn, transcript_path, end_offset, end_turn)
+            turns = end_turn
+    finally:
+        release_lease(conn, transcript_path, owner)
+    return sent
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    if not args:
+        print("Usage: transcript_export.py <transcript_path> [session_id] [--dry-run]", file=sys.stderr)
+        sys.exit(0)
+
+    send = store_memory
+    conn = None
+    if '--dry-run' in sys.argv:
+        # Print chunks instead of uploading, and don't touch the real progress store
+        def send(content):
+            print(content)
+            print('=' * 60)
+            return True
+        conn = open_sync_db(':memory:')
+
+    try:
+        # If the validator is installed but broken, this raises and nothing is sent
+        redact = load_redactor()
+        export_transcript(args[0], args[1] if len(args) > 1 else 'unknown', send, conn, redact)
+    except Exception as e:
+        print(f"Transcript export failed: {e}", file=sys.stderr)
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
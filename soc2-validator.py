@@ -9,16 +9,24 @@ Returns:
   - Exit 0 with JSON {"decision": "allow"} if clean
   - Exit 0 with JSON {"decision": "deny", "reason": "..."} if violation found
 
+Redaction Mode (for outbound payloads such as Hindsight capture):
+  - soc2-validator.py --redact            stdin text -> text with secrets masked
+  - soc2-validator.py --redact --jsonl    JSON records per line -> redacted JSONL (other lines as raw text)
+  - Importable: redact_text(), redact_records()
+
 Graceful Failure:
   - If anything goes wrong, ALLOW (don't block developer work)
   - Log errors for debugging
 """
 
 import json
+import math
 import re
 import sys
 import base64
 import os
+from collections import Counter
+from functools import lru_cache
 
 VERSION = "1.1.0"
 
@@ -43,27 +51,11 @@ OVERRIDE_PATTERNS = [
 
 # Patterns to detect
 PATTERNS = {
-    "hardcoded_password": [
-        r'password\s*[=:]\s*["\'][^"\']+["\']',
-        r'passwd\s*[=:]\s*["\'][^"\']+["\']',
-        r'pwd\s*[=:]\s*["\'][^"\']+["\']',
-        r'pass\s*[=:]\s*["\'][^"\']+["\']',
-    ],
-    "hardcoded_secret": [
-        r'secret\s*[=:]\s*["\'][^"\']+["\']',
-        r'api_key\s*[=:]\s*["\'][^"\']+["\']',
-        r'apikey\s*[=:]\s*["\'][^"\']+["\']',
-        r'api-key\s*[=:]\s*["\'][^"\']+["\']',
-        r'token\s*[=:]\s*["\'][^"\']+["\']',
-        r'bearer\s*[=:]\s*["\'][^"\']+["\']',
-        r'auth\s*[=:]\s*["\'][^"\']+["\']',
-        r'credential\s*[=:]\s*["\'][^"\']+["\']',
-    ],
+    # hardcoded_password / hardcoded_secret (and aws_key assignments) are
+    # found by the assignment extractor below, not by per-keyword regexes
     "aws_key": [
         r'AKIA[0-9A-Z]{16}',
         r'ASIA[0-9A-Z]{16}',
-        r'aws_access_key_id\s*[=:]\s*["\'][^"\']+["\']',
-        r'aws_secret_access_key\s*[=:]\s*["\'][^"\']+["\']',
     ],
     "private_ip": [
         r'\b10\.\d{1,3}\.\d{1,3}\.\d{1,3}\b',
@@ -92,6 +84,131 @@ PATTERNS = {
     ],
 }
 
+# Sensitive key names for the assignment extractor -> rule family.
+# Keys are normalized (last dotted segment, camelCase -> snake_case, lowercase,
+# '-' -> '_') and looked up by their underscore-separated suffixes, so
+# DB_PASSWORD, dbPassword and db-password all hit "password". Run-together
+# names (mypassword, adminpwd) fall back to an endswith check.
+SENSITIVE_KEYS = {
+    "password": "hardcoded_password",
+    "passwd": "hardcoded_password",
+    "pwd": "hardcoded_password",
+    "pass": "hardcoded_password",
+    "secret": "hardcoded_secret",
+    "api_key": "hardcoded_secret",
+    "apikey": "hardcoded_secret",
+    "token": "hardcoded_secret",
+    "bearer": "hardcoded_secret",
+    "auth": "hardcoded_secret",
+    "credential": "hardcoded_secret",
+    "credentials": "hardcoded_secret",
+    "private_key": "hardcoded_secret",
+    "aws_access_key_id": "aws_key",
+    "aws_secret_access_key": "aws_key",
+}
+
+# One pass over the content finds quoted key/value assignments in Python/JS
+# code, JSON, YAML, .env and INI. Like the old per-keyword regexes, whitespace
+# (including a newline) may separate the operator and the value.
+ASSIGNMENT_REGEX = re.compile(
+    r'(?<![\w.\-])(?P<key>[A-Za-z_][\w.\-]*)["\']?\s*(?::=|=>|[=:])\s*'
+    r'(?:"(?P<dq>[^"\n]+)"|\'(?P<sq>[^\'\n]+)\')'
+)
+
+# Unquoted values only count at the start of a line (YAML, .env, INI) in
+# line-oriented files - in code they are expressions, in docs they are prose.
+# Anchored per line, so each line's value is read at most once.
+BARE_VALUE_CATEGORIES = frozenset({"config", "infra", "unknown"})
+BARE_ASSIGNMENT_REGEX = re.compile(
+    r'^[ \t]*(?:export[ \t]+|-[ \t]+)?["\']?(?P<key>[A-Za-z_][\w.\-]*)["\']?[ \t]*(?::=|=>|[=:])[ \t]*'
+    r'(?P<bare>[^\s"\'#;,][^\n#;]*)',
+    re.MULTILINE,
+)
+_CAMEL_BOUNDARY = re.compile(r'(?<=[a-z0-9])(?=[A-Z])')
+# Short names only match as a whole word part (db_pass, dbPwd, PWD) - never
+# run together, so bypass, compass and OLDPWD aren't keys
+_SHORT_SENSITIVE_NAMES = frozenset({"pass", "pwd", "auth"})
+_SENSITIVE_NAMES_BY_LENGTH = sorted(set(SENSITIVE_KEYS) - _SHORT_SENSITIVE_NAMES, key=len, reverse=True)
+
+# Unquoted values that are configuration words, not secrets
+NON_SECRET_VALUES = frozenset({
+    "true", "false", "null", "none", "nil", "yes", "no", "on", "off",
+    "required", "optional", "enabled", "disabled",
+})
+# Unquoted paths (/home/app, ./data, ~/x, C:\\x) and plain words (basic, cache-layer)
+NON_SECRET_BARE_VALUE = re.compile(r'(?:/|\.{1,2}[\\/]|~|[A-Za-z]:[\\/])|[a-z-]+$')
+MIN_BARE_VALUE_LENGTH = 4
+MIN_BARE_VALUE_ENTROPY = 2.0  # bits per character
+
+# File categories for rule routing (same idea as hooks/track-file-types.js)
+# Order matters: the first matching category wins, so lockfiles are "data"
+# rather than "config" and CI workflow YAML is "infra" rather than "config".
+FILE_CATEGORIES = {
+    "data": [
+        r'(package-lock\.json|yarn\.lock|pnpm-lock\.yaml|poetry\.lock|Pipfile\.lock|Cargo\.lock|composer\.lock|Gemfile\.lock|go\.sum)$',
+        r'\.(lock|svg|csv|tsv|parquet|avro)$',
+        r'\.(png|jpe?g|gif|ico|webp|bmp|pdf|zip|gz|tar)$',
+        r'\.min\.(js|css)$',
+        r'\.map$',
+    ],
+    "infra": [
+        r'(^|[\\/])Dockerfile(\.(?!(md|markdown|txt|rst|adoc)$)[^\\/]*)?$',  # Not Dockerfile.md
+        r'(^|[\\/])docker-compose[^\\/]*\.ya?ml$',
+        r'\.gitlab-ci\.yml$',
+        r'\.github[\\/]workflows[\\/]',
+        r'\.circleci[\\/]',
+        r'\.(tf|tfvars|hcl|bicep)$',
+        r'(kubernetes|k8s|helm)[\\/]',
+        r'azure-pipelines\.yml$',
+        r'(Install|Deploy|Setup)-.*\.ps1$',
+    ],
+    "config": [
+        r'(^|[\\/])\.env(\.[^\\/]*)?$',
+        r'\.(json|yaml|yml|toml|ini|xml|properties)$',
+        r'\.(conf|config|cfg|psd1|csproj|props|targets)$',
+        r'requirements.*\.txt$',
+        r'\.(npmrc|pypirc|netrc)$',
+    ],
+    "code": [
+        r'\.(js|ts|jsx|tsx|mjs|cjs)$',
+        r'\.(py|pyw|pyx|ipynb)$',
+        r'\.(java|kt|kts|scala)$',
+        r'\.(go|rs|c|cpp|cc|h|hpp)$',
+        r'\.(cs|vb|fs)$',
+        r'\.(rb|php|swift|m|mm)$',
+        r'\.(sh|bash|zsh|ps1|psm1|bat|cmd|vbs|wsf|sql)$',
+    ],
+    "docs": [
+        r'\.(md|markdown|txt|rst|adoc|org)$',
+        r'(^|[\\/])(README|CHANGELOG|LICENSE|CONTRIBUTING)[^\\/]*$',
+    ],
+}
+
+# Categories where network topology and encoded blobs are worth checking.
+# Docs and data files only get the credential/token families.
+SOURCE_CATEGORIES = frozenset({"code", "config", "infra", "unknown"})
+ALL_CATEGORIES = frozenset(FILE_CATEGORIES) | {"unknown"}
+
+# Which file categories each rule family applies to
+RULE_CATEGORIES = {
+    "hardcoded_password": ALL_CATEGORIES,
+    "hardcoded_secret": ALL_CATEGORIES,
+    "aws_key": ALL_CATEGORIES,
+    "private_ip": SOURCE_CATEGORIES,
+    "internal_url": SOURCE_CATEGORIES,
+    "connection_string": ALL_CATEGORIES,
+    "pii_ssn": ALL_CATEGORIES,
+    "github_token": ALL_CATEGORIES,
+}
+
+# Base64 decoding is the most expensive check - skip it for docs and data
+BASE64_CATEGORIES = SOURCE_CATEGORIES
+
+_COMPILED_CATEGORIES = [
+    (category, [re.compile(p, re.IGNORECASE) for p in patterns])
+    for category, patterns in FILE_CATEGORIES.items()
+]
+
 # Safe patterns to ignore (false positives)
 SAFE_PATTERNS = [
     r'os\.environ\[',
@@ -128,6 +245,94 @@ def check_for_override(content: str) -> tuple[bool, str]:
     return False, ""
 
 
+def categorize_file(file_path: str) -> str:
+    """Return the file category for a path, or "unknown" (full scan)."""
+    if not file_path:
+        return "unknown"
+    for category, patterns in _COMPILED_CATEGORIES:
+        if any(p.search(file_path) for p in patterns):
+            return category
+    return "unknown"
+
+
+@lru_cache(maxsize=None)
+def get_scan_plan(category: str) -> tuple:
+    """
+    Build the precompiled rule subset for a file category (cached per category).
+    Returns (rules, check_base64) where rules is a tuple of (family, [compiled patterns]).
+    """
+    rules = tuple(
+        (family, [re.compile(p, re.IGNORECASE) for p in patterns])
+        for family, patterns in PATTERNS.items()
+        if category in RULE_CATEGORIES.get(family, ALL_CATEGORIES)
+    )
+    return rules, category in BASE64_CATEGORIES
+
+
+@lru_cache(maxsize=4096)
+def sensitive_key_family(key: str):
+    """Return the rule family for a sensitive assignment key, or None."""
+    key = key.rsplit(".", 1)[-1]
+    parts = _CAMEL_BOUNDARY.sub("_", key).lower().replace("-", "_").split("_")
+    for i in range(len(parts)):
+        family = SENSITIVE_KEYS.get("_".join(parts[i:]))
+        if family:
+            return family
+
+    # Names that don't split, e.g. mypassword or dbpassword (not the short names)
+    normalized = "_".join(parts)
+    for name in _SENSITIVE_NAMES_BY_LENGTH:
+        if normalized.endswith(name):
+            return SENSITIVE_KEYS[name]
+    return None
+
+
+def shannon_entropy(value: str) -> float:
+    """Bits of entropy per character."""
+    length = len(value)
+    return -sum(n / length * math.log2(n / length) for n in Counter(value).values())
+
+
+def looks_like_secret(value: str) -> bool:
+    """Entropy check for unquoted values (quoted literals are always candidates)."""
+    if value.lower() in NON_SECRET_VALUES or value[0] in "$%{[(<!&*|>" or "(" in value:
+        return False
+    if NON_SECRET_BARE_VALUE.match(value):
+        return False
+    return len(value) >= MIN_BARE_VALUE_LENGTH and shannon_entropy(value) >= MIN_BARE_VALUE_ENTROPY
+
+
+def find_sensitive_assignments(content: str, category: str) -> list:
+    """
+    Extract assignments to sensitive key names (one pass for quoted values,
+    plus one line-anchored pass for unquoted values in line-oriented files).
+    Returns (family, start, end, value_start, value_end) tuples, where
+    start..end covers the whole assignment and value_start..value_end the value.
+    """
+    families = {f for f in set(SENSITIVE_KEYS.values()) if category in RULE_CATEGORIES.get(f, ALL_CATEGORIES)}
+    found = []
+
+    for match in ASSIGNMENT_REGEX.finditer(content):
+        family = sensitive_key_family(match.group("key"))
+        if family not in families:
+            continue
+        group = "dq" if match.group("dq") is not None else "sq"
+        found.append((family, match.start("key"), match.end(), match.start(group), match.end(group)))
+
+    if category in BARE_VALUE_CATEGORIES:
+        for match in BARE_ASSIGNMENT_REGEX.finditer(content):
+            family = sensitive_key_family(match.group("key"))
+            if family not in families:
+                continue
+            value = match.group("bare").rstrip().rstrip(",")
+            if value and looks_like_secret(value):
+                value_start = match.start("bare")
+                value_end = value_start + len(value)
+                found.append((family, match.start("key"), value_end, value_start, value_end))
+
+    return found
+
+
 def is_safe_pattern(content: str, match: str) -> bool:
     """Check if the match is actually a safe pattern (false positive)."""
     # Get context around the match
@@ -151,28 +356,42 @@ def check_base64_secrets(content: str) -> list:
     # Find potential base64 strings (at least 20 chars)
     b64_pattern = r'["\']([A-Za-z0-9+/]{20,}={0,2})["\']'
 
+    # Decoded payloads have no file type of their own, so use the full rule set
+    rules, _ = get_scan_plan("unknown")
+
     for match in re.finditer(b64_pattern, content):
         try:
             decoded = base64.b64decode(match.group(1)).decode('utf-8', errors='ignore')
             # Check if decoded content contains secrets
-            for category, patterns in PATTERNS.items():
+            for category, patterns in rules:
                 for pattern in patterns:
-                    if re.search(pattern, decoded, re.IGNORECASE):
+                    if pattern.search(decoded):
                         violations.append(f"Encoded secret ({category}): base64 decodes to sensitive content")
                         break
+            for category in dict.fromkeys(a[0] for a in find_sensitive_assignments(decoded, "unknown")):
+                violations.append(f"Encoded secret ({category}): base64 decodes to sensitive content")
         except:
             pass
 
     return violations
 
 
-def scan_content(content: str) -> list:
-    """Scan content for SOC 2 violations."""
+def scan_content(content: str, file_path: str = "") -> list:
+    """
+    Scan content for SOC 2 violations.
+    Only the rule families that apply to the file's category are run.
+    """
+    return scan_category(content, categorize_file(file_path))
+
+
+def scan_category(content: str, category_name: str) -> list:
+    """Scan content with the rule plan for an explicit file category."""
     violations = []
+    rules, check_base64 = get_scan_plan(category_name)
 
-    for category, patterns in PATTERNS.items():
+    for category, patterns in rules:
         for pattern in patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
+            matches = pattern.finditer(content)
             for match in matches:
                 matched_text = match.group(0)
                 if not is_safe_pattern(content, matched_text):
@@ -180,13 +399,231 @@ def scan_content(content: str) -> list:
                     display = matched_text[:50] + "..." if len(matched_text) > 50 else matched_text
                     violations.append(f"{category}: {display}")
 
+    # Key/value assignments to sensitive names (one pass for all key names)
+    for family, start, end, _, _ in find_sensitive_assignments(content, category_name):
+        matched_text = content[start:end]
+        if not is_safe_pattern(content, matched_text):
+            display = matched_text[:50] + "..." if len(matched_text) > 50 else matched_text
+            violations.append(f"{family}: {display}")
+
     # Also check for encoded secrets
-    violations.extend(check_base64_secrets(content))
+    if check_base64:
+        violations.extend(check_base64_secrets(content))
+
+    return violations
+
+
+def load_notebook(content: str):
+    """Parse Jupyter notebook JSON. Returns None if content isn't a notebook."""
+    try:
+        notebook = json.loads(content)
+    except ValueError:
+        return None
+    if not isinstance(notebook, dict) or not isinstance(notebook.get("cells"), list):
+        return None
+    return notebook
+
 
+def _notebook_text(value) -> str:
+    """Notebook strings are stored either as one string or a list of lines."""
+    if isinstance(value, list):
+        return "".join(v for v in value if isinstance(v, str))
+    return value if isinstance(value, str) else ""
+
+
+def iter_notebook_parts(notebook: dict):
+    """
+    Yield (cell_index, category, text) for the scannable parts of a notebook:
+    cell sources and plain-text outputs. Image and other binary MIME bundles
+    (and markdown attachments) are skipped without being decoded.
+    """
+    for index, cell in enumerate(notebook.get("cells", [])):
+        if not isinstance(cell, dict):
+            continue
+        category = "docs" if cell.get("cell_type") == "markdown" else "code"
+        yield index, category, _notebook_text(cell.get("source"))
+
+        for output in cell.get("outputs") or []:
+            if not isinstance(output, dict):
+                continue
+            if output.get("output_type") == "stream":
+                yield index, "code", _notebook_text(output.get("text"))
+            elif output.get("output_type") == "error":
+                yield index, "code", "\n".join(_notebook_text(line) for line in output.get("traceback") or [])
+            else:
+                # execute_result / display_data - only text/* MIME types
+                bundle = output.get("data")
+                if not isinstance(bundle, dict):
+                    continue
+                for mime, data in bundle.items():
+                    if mime.startswith("text/"):
+                        yield index, "code", _notebook_text(data)
+
+
+def scan_notebook(notebook: dict) -> list:
+    """Scan a parsed notebook, reporting violations by cell index."""
+    violations = []
+    for index, category, text in iter_notebook_parts(notebook):
+        if text:
+            violations.extend(f"{v} (cell {index})" for v in scan_category(text, category))
     return violations
 
 
+def notebook_override_text(notebook: dict) -> str:
+    """The SOC2_OVERRIDE comment for a notebook lives in its first cell."""
+    for cell in notebook.get("cells", []):
+        if isinstance(cell, dict):
+            return _notebook_text(cell.get("source"))
+    return ""
+
+
+# Redaction - masks matched spans instead of allowing/denying
+REDACTION_MASK = "[REDACTED:{family}]"
+
+_B64_REGEX = re.compile(r'["\']([A-Za-z0-9+/]{20,}={0,2})["\']')
+
+
+@lru_cache(maxsize=None)
+def get_redaction_regex(category: str = "unknown"):
+    """
+    Combine a category's rule families into one alternation with a named group
+    per family, so finding every span is a single pass over the text.
+    """
+    rules = [(family, PATTERNS[family]) for family, _ in get_scan_plan(category)[0]]
+    return re.compile(
+        "|".join(f"(?P<{family}>{'|'.join(patterns)})" for family, patterns in rules),
+        re.IGNORECASE,
+    )
+
+
+def find_secret_spans(content: str, category: str = "unknown") -> list:
+    """
+    Return sorted, non-overlapping (start, end, family) spans to mask.
+    SAFE_PATTERNS are deliberately not applied: masking a placeholder in an
+    outbound payload is harmless, while letting a real secret through is not.
+    """
+    spans = [(m.start(), m.end(), m.lastgroup) for m in get_redaction_regex(category).finditer(content)]
+    # Assignments keep their key name - only the value is masked
+    spans.extend((value_start, value_end, family)
+                 for family, _, _, value_start, value_end in find_sensitive_assignments(content, category))
+
+    if get_scan_plan(category)[1]:
+        decoded_regex = get_redaction_regex("unknown")
+        for m in _B64_REGEX.finditer(content):
+            try:
+                decoded = base64.b64decode(m.group(1)).decode('utf-8', errors='ignore')
+            except Exception:
+                continue
+            found = decoded_regex.search(decoded)
+            if found:
+                spans.append((m.start(1), m.end(1), found.lastgroup))
+                continue
+            assignments = find_sensitive_assignments(decoded, "unknown")
+            if assignments:
+                spans.append((m.start(1), m.end(1), assignments[0][0]))
+
+    spans.sort()
+    merged = []
+    for start, end, family in spans:
+        if merged and start < merged[-1][1]:
+            prev_start, prev_end, prev_family = merged[-1]
+            merged[-1] = (prev_start, max(prev_end, end), prev_family)
+        else:
+            merged.append((start, end, family))
+    return merged
+
+
+def redact_text(content: str, file_path: str = "") -> str:
+    """Return content with every secret span replaced by REDACTION_MASK."""
+    if not content:
+        return content
+    spans = find_secret_spans(content, categorize_file(file_path))
+    if not spans:
+        return content
+
+    # Single pass: copy the text between spans, mask the spans
+    parts = []
+    pos = 0
+    for start, end, family in spans:
+        parts.append(content[pos:start])
+        parts.append(REDACTION_MASK.format(family=family))
+        pos = end
+    parts.append(content[pos:])
+    return "".join(parts)
+
+
+def redact_value(value, file_path: str = ""):
+    """
+    Redact a string, or every string inside a JSON-like dict/list.
+    A string stored under a sensitive key ({"DB_PASSWORD": ...}) is masked whole.
+    """
+    if isinstance(value, str):
+        return redact_text(value, file_path)
+    if isinstance(value, dict):
+        redacted = {}
+        for k, v in value.items():
+            family = sensitive_key_family(k) if isinstance(v, str) and v else None
+            redacted[k] = REDACTION_MASK.format(family=family) if family else redact_value(v, file_path)
+        return redacted
+    if isinstance(value, list):
+        return [redact_value(v, file_path) for v in value]
+    return value
+
+
+def redact_records(records, file_path: str = ""):
+    """
+    Batch interface - yield each record (string or JSON-like value) redacted.
+    The compiled rules are built once and shared by every record.
+    """
+    get_redaction_regex(categorize_file(file_path))
+    for record in records:
+        yield redact_value(record, file_path)
+
+
+def redact_main() -> int:
+    """
+    CLI redaction mode:
+      soc2-validator.py --redact            stdin text -> redacted text
+      soc2-validator.py --redact --jsonl    one JSON record per line -> redacted JSONL
+                                            (lines that aren't JSON come back as redacted raw text)
+    """
+    if "--jsonl" in sys.argv:
+        for line in sys.stdin:
+            line = line.rstrip("\n")
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                sys.stdout.write(redact_text(line) + "\n")
+            else:
+                sys.stdout.write(json.dumps(redact_value(record)) + "\n")
+    else:
+        sys.stdout.write(redact_text(sys.stdin.read()))
+    return 0
+
+
+def record_findings(file_path: str, violations: list, decision: str) -> None:
+    """
+    Record rule hits in the shared enforcement state store (hooks/enforcement_state.py).
+    Best effort - a missing or locked store never changes the decision.
+    """
+    try:
+        import enforcement_state
+    except ImportError:
+        return
+    try:
+        rules = [v.split(":", 1)[0] for v in violations]
+        enforcement_state.record_findings(file_path, rules, decision)
+        enforcement_state.export_json()
+    except Exception as e:
+        print(f"Failed to record SOC 2 findings: {e}", file=sys.stderr)
+
+
 def main():
+    if "--redact" in sys.argv:
+        sys.exit(redact_main())
+
     # Read input from Claude Code (JSON on stdin)
     try:
         input_data = json.loads(sys.stdin.read())
@@ -197,14 +634,20 @@ def main():
     # Extract content to scan
     # PreToolUse provides tool input in different formats
     content = ""
+    file_path = ""
 
     if "tool_input" in input_data:
         tool_input = input_data["tool_input"]
         if isinstance(tool_input, dict):
+            file_path = tool_input.get("file_path", "") or tool_input.get("path", "")
             # Write/Edit tool input
             content = tool_input.get("content", "")
             if not content:
                 content = tool_input.get("new_string", "")
+            # NotebookEdit tool input (a single cell's source)
+            if not content:
+                content = tool_input.get("new_source", "")
+                file_path = file_path or tool_input.get("notebook_path", "")
         else:
             content = str(tool_input)
     elif "content" in input_data:
@@ -221,13 +664,20 @@ def main():
         print(json.dumps(result))
         sys.exit(0)
 
+    # Whole-notebook writes are scanned cell by cell, skipping output blobs
+    notebook = load_notebook(content) if file_path.lower().endswith(".ipynb") else None
+
     # Check for explicit override
-    has_override, override_reason = check_for_override(content)
+    has_override, override_reason = check_for_override(
+        notebook_override_text(notebook) if notebook else content
+    )
 
     # Scan for violations
-    violations = scan_content(content)
+    violations = scan_notebook(notebook) if notebook else scan_content(content, file_path)
 
     if violations:
+        record_findings(file_path, violations, "override" if has_override else "deny")
+
         if has_override:
             # Override present - ALLOW but warn
             violation_list = "\n".join(f"  - {v}" for v in violations[:5])  # Show first 5